@@ -18,11 +18,52 @@ from __future__ import annotations
 
 import time
 import json
+import asyncio
 import datetime as dt
-from dataclasses import dataclass, field
-from typing import Any, Optional
+import functools
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson is optional: a faster drop-in for (de)serializing API payloads
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+try:
+    # ijson is optional: streams large Loki responses instead of loading them whole
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore
+
+
+try:
+    # httpx is only needed for the Async* clients (HTTP/2 when `h2` is installed)
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+
+        _HTTP2 = True
+    except ImportError:  # pragma: no cover
+        _HTTP2 = False
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
 
 try:
     # Prefect is only needed for Secrets; SDK still works without it
@@ -36,35 +77,59 @@ except Exception:  # pragma: no cover
 # ------------------------
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 ADMIN_MAP = {1: "enable", 2: "disable"}
 OPER_MAP = {1: "up", 2: "down", 3: "idle", 4: "connect", 5: "active"}
 
+# Line filters used by bgp_logql (matched as plain substrings, case-sensitive)
+BGP_LOG_TERMS = ("bgp", "BGP", "neighbor", "session", "route", "ipv4-unicast")
+
+# Constant parts of the quarantine silence / decision annotation payloads
+# (shared between calls - never mutate them)
+_BGP_ALERT_MATCHER = {"name": "alertname", "value": "BgpSessionNotUp", "isRegex": False}
+_ANNOTATION_SOURCE = {"source": "prefect"}
+
+# (snapshot key, Prometheus metric name, default when the series is missing)
+BGP_METRICS = (
+    ("admin_state", "bgp_admin_state", -1),
+    ("oper_state", "bgp_oper_state", -1),
+    ("received_routes", "bgp_received_routes", 0),
+    ("sent_routes", "bgp_sent_routes", 0),
+    ("suppressed_routes", "bgp_suppressed_routes", 0),
+    ("active_routes", "bgp_active_routes", 0),
+)
+
+# snapshot key -> metric name, the shape PromClient.instant_multi expects
+BGP_METRIC_NAMES = {key: name for key, name, _ in BGP_METRICS}
+
 
 def decode_bgp_states(metrics: dict[str, float]) -> dict[str, str]:
-    def _as_int(v: float | int | None) -> int | None:
+    decoded: dict[str, str] = {}
+    for key, enum_map in (("admin_state", ADMIN_MAP), ("oper_state", OPER_MAP)):
+        v = metrics.get(key)
         if v is None:
-            return None
+            continue
         try:
-            return int(v)
-        except Exception:
-            return None
+            int(v)
+        except (TypeError, ValueError, OverflowError):
+            continue
+        # same rule as _decode_admin_state/_decode_oper_state (1.5 -> "unknown(1.5)", -1 -> "unknown")
+        decoded[key] = _decode_enum(v, enum_map)
+    return decoded
 
-    admin_i = _as_int(metrics.get("admin_state"))
-    oper_i = _as_int(metrics.get("oper_state"))
 
-    decoded: dict[str, str] = {}
-    if admin_i is not None:
-        decoded["admin_state"] = ADMIN_MAP.get(admin_i, str(admin_i))
-    if oper_i is not None:
-        decoded["oper_state"] = OPER_MAP.get(oper_i, str(oper_i))
-    return decoded
+_UTC = dt.timezone.utc
+_NOW = dt.datetime.now
 
 
 def now_utc() -> dt.datetime:
-    return dt.datetime.now(dt.timezone.utc)
+    return _NOW(_UTC)
 
 
 def to_rfc3339(ts: dt.datetime) -> str:
+    if ts.tzinfo is _UTC:
+        return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
     return ts.isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
@@ -81,9 +146,26 @@ def first_prom_value(result: list[dict], default: float = 0.0) -> float:
         return float(default)
 
 
+def _http_session() -> requests.Session:
+    """
+    One Session per client = HTTP keep-alive (no new TCP/TLS handshake per call).
+    Idempotent requests get a couple of quick retries on gateway errors.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+    )
+    s = requests.Session()
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+@functools.lru_cache(maxsize=32)
 def _load_secret(name: str) -> str:
     """
-    Load a Prefect Secret block by name.
+    Load a Prefect Secret block by name (once per process; the value is cached).
     Raises a helpful error if Prefect isn't available.
     """
     if Secret is None:
@@ -94,34 +176,26 @@ def _load_secret(name: str) -> str:
     return Secret.load(name).get()  # type: ignore
 
 
-def _decode_admin_state(v: float) -> str:
-    # telegraf enum mapping:
-    # enable=1, disable=2
-    if v == 1:
-        return "enable"
-    if v == 2:
-        return "disable"
-    if v == -1:
-        return "unknown"
-    return f"unknown({v})"
-
-
-def _decode_oper_state(v: float) -> str:
-    # telegraf enum mapping:
-    # up=1, down=2, idle=3, connect=4, active=5
+def _decode_enum(v: float, enum_map: dict[int, str]) -> str:
+    # -1 is the "series missing" default used by bgp_metrics_snapshot
     try:
         key = int(v)
-    except (ValueError, OverflowError):
+    except (TypeError, ValueError, OverflowError):
+        return f"unknown({v})"
+    if key != v:
+        # don't truncate non-integral values (1.5 is not "enable")
         return f"unknown({v})"
+    if key == -1:
+        return "unknown"
+    return enum_map.get(key, f"unknown({v})")
 
-    return {
-        1: "up",
-        2: "down",
-        3: "idle",
-        4: "connect",
-        5: "active",
-        -1: "unknown",
-    }.get(key, f"unknown({v})")
+
+def _decode_admin_state(v: float) -> str:
+    return _decode_enum(v, ADMIN_MAP)
+
+
+def _decode_oper_state(v: float) -> str:
+    return _decode_enum(v, OPER_MAP)
 
 
 def bgp_metrics_hint(metrics: dict[str, float], decoded: dict[str, str] | None = None) -> str:
@@ -130,13 +204,22 @@ def bgp_metrics_hint(metrics: dict[str, float], decoded: dict[str, str] | None =
       admin_state: enable=1, disable=2
       oper_state:  up=1, down=2, idle=3, connect=4, active=5
     """
-    admin = metrics.get("admin_state", -1)
-    oper = metrics.get("oper_state", -1)
+    return _bgp_metrics_hint_cached(
+        metrics.get("admin_state", -1),
+        metrics.get("oper_state", -1),
+        metrics.get("received_routes", 0),
+        metrics.get("sent_routes", 0),
+        metrics.get("suppressed_routes", 0),
+        metrics.get("active_routes", 0),
+        (decoded or {}).get("oper_state"),
+    )
+
 
-    rx = metrics.get("received_routes", 0)
-    tx = metrics.get("sent_routes", 0)
-    sup = metrics.get("suppressed_routes", 0)
-    act = metrics.get("active_routes", 0)
+@functools.lru_cache(maxsize=1024)
+def _bgp_metrics_hint_cached(
+    admin: float, oper: float, rx: float, tx: float, sup: float, act: float, decoded_oper: str | None
+) -> str:
+    # Pure over its inputs -> memoized (same snapshot is often summarized several times)
 
     # If these are unknown/missing, *then* it’s insufficient.
     if admin in (-1, None) or oper in (-1, None):
@@ -148,7 +231,7 @@ def bgp_metrics_hint(metrics: dict[str, float], decoded: dict[str, str] | None =
 
     # Oper not UP
     if oper != 1:
-        oper_txt = (decoded or {}).get("oper_state") or str(int(oper))
+        oper_txt = decoded_oper or str(int(oper))
         return f"Oper not UP ({oper_txt}) → likely session not established (reachability/auth/timers)."
 
     # Oper UP from here down
@@ -164,7 +247,7 @@ def bgp_metrics_hint(metrics: dict[str, float], decoded: dict[str, str] | None =
     return "Metrics present but inconclusive (need more context)."
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Endpoints:
     nautobot_url: str = "http://localhost:8080"
     prom_url: str = "http://localhost:9090"
@@ -172,11 +255,15 @@ class Endpoints:
     loki_url: str = "http://localhost:3001"
 
 
-@dataclass
+@dataclass(slots=True)
 class EvidenceBundle:
     """
     A small, workshop-friendly container for evidence.
     Keeps printing + posting consistent and reduces "dict soup".
+
+    summary() is built once and cached; assigning any field (ev.metrics = ...)
+    invalidates it. In-place edits (ev.sot["x"] = ...) do not - reassign instead.
+    Every call returns that same dict: treat it as read-only (copy it to modify).
     """
 
     device: str
@@ -188,7 +275,19 @@ class EvidenceBundle:
     logs: list[str] = field(default_factory=list)
     sot: dict[str, Any] = field(default_factory=dict)
 
+    _summary_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_summary_cache":
+            object.__setattr__(self, "_summary_cache", None)
+
     def summary(self) -> dict[str, Any]:
+        if self._summary_cache is None:
+            self._summary_cache = self._build_summary()
+        return self._summary_cache
+
+    def _build_summary(self) -> dict[str, Any]:
         decoded = self.sot.get("decoded") or {}
         hint = bgp_metrics_hint(self.metrics or {}, decoded=decoded)
         return {
@@ -197,7 +296,7 @@ class EvidenceBundle:
             "afi_safi": self.afi_safi,
             "instance_name": self.instance_name,
             "bgp_metrics_hint": hint,
-            "metrics": self.metrics,
+            "metrics": dict(self.metrics),
             "log_lines": len(self.logs),
             "sot": {
                 "found": self.sot.get("found"),
@@ -207,21 +306,22 @@ class EvidenceBundle:
                 "site": self.sot.get("site"),
                 "role": self.sot.get("role"),
             },
-            "decoded": decoded,
+            "decoded": dict(decoded),
         }
 
     def to_rca_payload(self, max_log_lines: int = 40) -> dict[str, Any]:
         """
         What we send into the RCA prompt.
         """
+        logs = self.logs if len(self.logs) <= max_log_lines else self.logs[:max_log_lines]
         return {
             "metrics": self.metrics,
-            "logs": self.logs[:max_log_lines],
+            "logs": logs,
             "sot": self.sot,
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Decision:
     ok: bool
     decision: str  # "proceed" | "skip" | "stop"
@@ -246,10 +346,16 @@ class DecisionPolicy:
       require_admin_up_for_quarantine=True
         -> only proceed when admin_state is ENABLE (1) but oper_state is NOT UP (!= 1)
         (prevents “quarantine” when peer is intentionally disabled)
+
+    The rules above live in _evaluate_rules(). Since the inputs are a handful of
+    flags and small enums, every common combination is pre-computed once into a
+    lookup table (see _decision_table); evaluate() is a tuple lookup and only
+    falls back to the rules for unusual inputs (e.g. unknown enum values).
     """
 
     def __init__(self, require_admin_up_for_quarantine: bool = False):
         self.require_admin_up_for_quarantine = require_admin_up_for_quarantine
+        self._table = _decision_table(require_admin_up_for_quarantine)
 
     @staticmethod
     def _as_int(x: object, default: int = -1) -> int:
@@ -261,55 +367,125 @@ class DecisionPolicy:
 
     def evaluate(self, sot_gate: dict[str, Any], metrics: Optional[dict[str, float]] = None) -> Decision:
         if not sot_gate.get("found", True):
+            # reason is free text from the gate -> not table-driven
             return Decision(ok=False, decision="stop", reason=sot_gate.get("reason", "device not found"))
+        return self._lookup(sot_gate, self._sot_key(sot_gate), metrics)
 
-        if sot_gate.get("maintenance"):
-            return Decision(ok=False, decision="skip", reason="device under maintenance")
+    def evaluate_two_stage(
+        self, sot_gate: dict[str, Any], metrics: Optional[dict[str, float]]
+    ) -> tuple[Decision, Decision]:
+        """
+        SoT-only decision, then SoT + metrics, in one pass.
 
-        if not sot_gate.get("intended_peer"):
-            return Decision(ok=False, decision="skip", reason="peer not intended in SoT")
+        Returns (sot_decision, final). When the SoT gate already stops/skips,
+        final is sot_decision and metrics are never looked at.
+        """
+        if not sot_gate.get("found", True):
+            decision = Decision(ok=False, decision="stop", reason=sot_gate.get("reason", "device not found"))
+            return decision, decision
 
-        expected = (sot_gate.get("expected_state") or "established").lower()
+        sot_key = self._sot_key(sot_gate)
+        sot_decision = self._lookup(sot_gate, sot_key, None)
+        if sot_decision.decision in ("stop", "skip"):
+            return sot_decision, sot_decision
+        return sot_decision, self._lookup(sot_gate, sot_key, metrics)
 
-        # If SoT expects DOWN, treat DOWN as expected behavior
-        if expected in {"down", "disabled"}:
-            return Decision(ok=False, decision="skip", reason="SoT expects this peer to be down/disabled")
+    @staticmethod
+    def _sot_key(sot_gate: dict[str, Any]) -> tuple[bool, bool, str]:
+        return (
+            bool(sot_gate.get("maintenance")),
+            bool(sot_gate.get("intended_peer")),
+            (sot_gate.get("expected_state") or "established").lower(),
+        )
 
-        # Expected UP (established)
+    def _lookup(
+        self, sot_gate: dict[str, Any], sot_key: tuple[bool, bool, str], metrics: Optional[dict[str, float]]
+    ) -> Decision:
         if metrics is None:
-            return Decision(ok=True, decision="proceed", reason="SoT expects up; metrics not provided (collect evidence)")
-
-        admin = self._as_int(metrics.get("admin_state", -1))
-        oper = self._as_int(metrics.get("oper_state", -1))
-
-        # Telegraf enum mapping:
-        # admin_state: enable=1, disable=2
-        # oper_state: up=1, down=2, idle=3, connect=4, active=5
-        admin_ok = (admin == 1)
-        oper_ok = (oper == 1)
-
-        # If everything matches intent, no action needed
-        if admin_ok and oper_ok:
-            return Decision(ok=False, decision="skip", reason="peer matches SoT intent (enabled + up)")
-
-        # Optional stricter gating:
-        # only proceed if admin is enabled but oper isn't up
-        if self.require_admin_up_for_quarantine:
-            if not (admin_ok and not oper_ok):
-                return Decision(
-                    ok=False,
-                    decision="skip",
-                    reason="metrics gate not met (expected admin_state=enable and oper_state!=up)",
-                    details={"admin_state": admin, "oper_state": oper, "expected_state": expected},
-                )
+            admin = oper = None
+        else:
+            admin = self._as_int(metrics.get("admin_state", -1))
+            oper = self._as_int(metrics.get("oper_state", -1))
+
+        decision = self._table.get((*sot_key, admin, oper))
+        if decision is None:
+            return _evaluate_rules(sot_gate, metrics, self.require_admin_up_for_quarantine)
+        # table entries are shared -> give the caller its own details dict
+        return replace(decision, details=dict(decision.details))
+
+
+def _evaluate_rules(
+    sot_gate: dict[str, Any], metrics: Optional[dict[str, float]], require_admin_up_for_quarantine: bool
+) -> Decision:
+    if not sot_gate.get("found", True):
+        return Decision(ok=False, decision="stop", reason=sot_gate.get("reason", "device not found"))
+
+    if sot_gate.get("maintenance"):
+        return Decision(ok=False, decision="skip", reason="device under maintenance")
+
+    if not sot_gate.get("intended_peer"):
+        return Decision(ok=False, decision="skip", reason="peer not intended in SoT")
+
+    expected = (sot_gate.get("expected_state") or "established").lower()
+
+    # If SoT expects DOWN, treat DOWN as expected behavior
+    if expected in {"down", "disabled"}:
+        return Decision(ok=False, decision="skip", reason="SoT expects this peer to be down/disabled")
+
+    # Expected UP (established)
+    if metrics is None:
+        return Decision(ok=True, decision="proceed", reason="SoT expects up; metrics not provided (collect evidence)")
+
+    admin = DecisionPolicy._as_int(metrics.get("admin_state", -1))
+    oper = DecisionPolicy._as_int(metrics.get("oper_state", -1))
+
+    # Telegraf enum mapping:
+    # admin_state: enable=1, disable=2
+    # oper_state: up=1, down=2, idle=3, connect=4, active=5
+    admin_ok = (admin == 1)
+    oper_ok = (oper == 1)
+
+    # If everything matches intent, no action needed
+    if admin_ok and oper_ok:
+        return Decision(ok=False, decision="skip", reason="peer matches SoT intent (enabled + up)")
+
+    # Optional stricter gating:
+    # only proceed if admin is enabled but oper isn't up
+    if require_admin_up_for_quarantine:
+        if not (admin_ok and not oper_ok):
+            return Decision(
+                ok=False,
+                decision="skip",
+                reason="metrics gate not met (expected admin_state=enable and oper_state!=up)",
+                details={"admin_state": admin, "oper_state": oper, "expected_state": expected},
+            )
+
+    # Otherwise mismatch is actionable
+    return Decision(
+        ok=True,
+        decision="proceed",
+        reason="SoT expects peer up, but metrics show mismatch",
+        details={"expected_state": expected, "admin_state": admin, "oper_state": oper},
+    )
 
-        # Otherwise mismatch is actionable
-        return Decision(
-            ok=True,
-            decision="proceed",
-            reason="SoT expects peer up, but metrics show mismatch",
-            details={"expected_state": expected, "admin_state": admin, "oper_state": oper},
-        )
+
+@functools.lru_cache(maxsize=2)
+def _decision_table(require_admin_up_for_quarantine: bool) -> dict[tuple, Decision]:
+    """
+    (maintenance, intended_peer, expected_state, admin_state, oper_state) -> Decision,
+    built once per policy flavour by running the rules over every known combination.
+    admin_state/oper_state are None when metrics were not provided.
+    Entries are shared between lookups, so DecisionPolicy hands out copies.
+    """
+    states = [(None, None), *itertools.product((-1, *ADMIN_MAP), (-1, *OPER_MAP))]
+    table: dict[tuple, Decision] = {}
+    for maintenance, intended, expected, (admin, oper) in itertools.product(
+        (False, True), (False, True), ("established", "down", "disabled"), states
+    ):
+        sot_gate = {"found": True, "maintenance": maintenance, "intended_peer": intended, "expected_state": expected}
+        metrics = None if admin is None else {"admin_state": admin, "oper_state": oper}
+        table[(maintenance, intended, expected, admin, oper)] = _evaluate_rules(sot_gate, metrics, require_admin_up_for_quarantine)
+    return table
 
 
 # ------------------------
@@ -317,59 +493,189 @@ class DecisionPolicy:
 # ------------------------
 
 
+def _prom_multi_query(queries: dict[str, str], matchers: str) -> str:
+    names = "|".join(queries.values())
+    return f'{{__name__=~"{names}",{matchers}}}'
+
+
+def _prom_split_by_name(result: list[dict], queries: dict[str, str]) -> dict[str, list[dict]]:
+    by_name: dict[str, list[dict]] = {}
+    for sample in result:
+        by_name.setdefault(sample.get("metric", {}).get("__name__", ""), []).append(sample)
+    return {key: by_name.get(name, []) for key, name in queries.items()}
+
+
+def _bgp_snapshot(results: dict[str, list[dict]]) -> dict[str, float]:
+    """instant_multi(BGP_METRIC_NAMES, ...) output -> {"admin_state": 1.0, ...} with per-metric defaults."""
+    return {key: first_prom_value(results[key], default=default) for key, _, default in BGP_METRICS}
+
+
+def _loki_range_params(query: str, minutes: int, limit: int) -> dict[str, Any]:
+    end = now_utc()
+    start = end - dt.timedelta(minutes=minutes)
+    return {
+        "query": query,
+        "start": int(start.timestamp() * 1e9),  # ns
+        "end": int(end.timestamp() * 1e9),
+        "limit": limit,
+        "direction": "BACKWARD",
+    }
+
+
+def _loki_lines(payload: dict[str, Any], limit: int) -> list[str]:
+    lines: list[str] = []
+    for stream in payload.get("data", {}).get("result", []):
+        lines.extend(line for _, line in stream.get("values", []))
+        if len(lines) >= limit:
+            break
+    return lines[:limit]
+
+
+def _loki_push_payload(labels: dict[str, str], message: str) -> dict[str, Any]:
+    ts = str(time.time_ns())
+    return {"streams": [{"stream": labels, "values": [[ts, message]]}]}
+
+
+def _loki_push_payload_many(entries: Iterable[tuple[dict[str, str], str]]) -> dict[str, Any]:
+    # One stream per entry (labels may differ); +i ns keeps entries in submission order
+    ts = time.time_ns()
+    return {
+        "streams": [
+            {"stream": labels, "values": [[str(ts + i), message]]} for i, (labels, message) in enumerate(entries)
+        ]
+    }
+
+
+def _bgp_silence_matchers(device: str, peer_address: str) -> list[dict[str, Any]]:
+    return [
+        _BGP_ALERT_MATCHER,
+        {"name": "device", "value": device, "isRegex": False},
+        {"name": "peer_address", "value": peer_address, "isRegex": False},
+    ]
+
+
+def _action_labels(workflow: str, device: str, peer_address: str) -> dict[str, str]:
+    return {**_ANNOTATION_SOURCE, "workflow": workflow, "device": device, "peer_address": peer_address}
+
+
+def _quarantine_annotations(
+    workflow: str, device: str, peer_address: str, decision: str, reason: str, silence_id: str
+) -> list[tuple[dict[str, str], str]]:
+    return [
+        (_decision_labels(workflow, device, peer_address, decision), reason),
+        (_action_labels(workflow, device, peer_address), f"QUARANTINE applied (silence_id={silence_id})"),
+    ]
+
+
+def _decision_labels(workflow: str, device: str, peer_address: str, decision: str) -> dict[str, str]:
+    return {
+        **_ANNOTATION_SOURCE,
+        "workflow": workflow,
+        "device": device,
+        "peer_address": peer_address,
+        "decision": decision,
+    }
+
+
+def _silence_body(matchers: list[dict[str, Any]], minutes: int, created_by: str, comment: str) -> dict[str, Any]:
+    starts = now_utc()
+    ends = starts + dt.timedelta(minutes=minutes)
+    return {
+        "matchers": matchers,
+        "startsAt": to_rfc3339(starts),
+        "endsAt": to_rfc3339(ends),
+        "createdBy": created_by,
+        "comment": comment,
+    }
+
+
+def _cached_device(cache: dict[str, tuple[float, dict]], device_name: str) -> dict | None:
+    # cache: name -> (expires_at, device), as kept by the Nautobot clients
+    hit = cache.get(device_name)
+    if hit and hit[0] > time.monotonic():
+        return hit[1]
+    return None
+
+
 class PromClient:
     def __init__(self, base_url: str, timeout: int = 10):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.session = _http_session()
 
     def instant(self, query: str) -> list[dict]:
-        r = requests.get(
+        r = self.session.get(
             f"{self.base_url}/api/v1/query",
             params={"query": query},
             timeout=self.timeout,
         )
         r.raise_for_status()
-        payload = r.json()
+        payload = _json_loads(r.content)
         return payload.get("data", {}).get("result", [])
 
+    def instant_multi(self, queries: dict[str, str], matchers: str) -> dict[str, list[dict]]:
+        """
+        Fetch several metrics sharing the same label matchers in ONE request.
+
+        queries maps a result key -> metric name, e.g. {"oper_state": "bgp_oper_state"}.
+        Builds `{__name__=~"m1|m2|...",<matchers>}` and splits the samples back
+        out per key, so each value has the same shape as `instant()` returns.
+        """
+        result = self.instant(_prom_multi_query(queries, matchers))
+        return _prom_split_by_name(result, queries)
+
+    def instant_many(self, queries: list[str], max_workers: int = 8) -> list[list[dict]]:
+        """
+        Run independent instant queries in parallel over the pooled session.
+        Results come back in the same order as `queries`.
+        """
+        if not queries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as pool:
+            return list(pool.map(self.instant, queries))
+
 
 class LokiClient:
     def __init__(self, base_url: str, timeout: int = 10):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.session = _http_session()
 
     def query_range(self, query: str, minutes: int = 10, limit: int = 200) -> list[str]:
-        end = now_utc()
-        start = end - dt.timedelta(minutes=minutes)
-
-        params = {
-            "query": query,
-            "start": int(start.timestamp() * 1e9),  # ns
-            "end": int(end.timestamp() * 1e9),
-            "limit": limit,
-            "direction": "BACKWARD",
-        }
-        r = requests.get(
-            f"{self.base_url}/loki/api/v1/query_range",
-            params=params,
+        url = f"{self.base_url}/loki/api/v1/query_range"
+        params = _loki_range_params(query, minutes=minutes, limit=limit)
+
+        if ijson is None:
+            r = self.session.get(url, params=params, timeout=self.timeout)
+            r.raise_for_status()
+            return _loki_lines(_json_loads(r.content), limit=limit)
+
+        # Stream-parse: only the [ts, line] pairs are materialized, and we stop at `limit`
+        with self.session.get(url, params=params, timeout=self.timeout, stream=True) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True  # transparently gunzip
+            lines: list[str] = []
+            for _, line in ijson.items(r.raw, "data.result.item.values.item"):
+                lines.append(line)
+                if len(lines) >= limit:
+                    break
+            return lines
+
+    def annotate(self, labels: dict[str, str], message: str) -> None:
+        r = self.session.post(
+            f"{self.base_url}/loki/api/v1/push",
+            data=_json_dumps(_loki_push_payload(labels, message)),
+            headers=_JSON_HEADERS,
             timeout=self.timeout,
         )
         r.raise_for_status()
-        payload = r.json()
 
-        lines: list[str] = []
-        for stream in payload.get("data", {}).get("result", []):
-            for _, line in stream.get("values", []):
-                lines.append(line)
-
-        return lines[:limit]
-
-    def annotate(self, labels: dict[str, str], message: str) -> None:
-        ts = str(time.time_ns())
-        payload = {"streams": [{"stream": labels, "values": [[ts, message]]}]}
-        r = requests.post(
+    def annotate_many(self, entries: Iterable[tuple[dict[str, str], str]]) -> None:
+        """Several (labels, message) annotations in a single push request."""
+        r = self.session.post(
             f"{self.base_url}/loki/api/v1/push",
-            json=payload,
+            data=_json_dumps(_loki_push_payload_many(entries)),
+            headers=_JSON_HEADERS,
             timeout=self.timeout,
         )
         r.raise_for_status()
@@ -379,6 +685,7 @@ class AlertmanagerClient:
     def __init__(self, base_url: str, timeout: int = 10):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.session = _http_session()
 
     def create_silence(
         self,
@@ -387,23 +694,15 @@ class AlertmanagerClient:
         created_by: str = "prefect-workshop",
         comment: str = "Workshop quarantine: suppress repeat notifications while investigating.",
     ) -> str:
-        starts = now_utc()
-        ends = starts + dt.timedelta(minutes=minutes)
-
-        body = {
-            "matchers": matchers,
-            "startsAt": to_rfc3339(starts),
-            "endsAt": to_rfc3339(ends),
-            "createdBy": created_by,
-            "comment": comment,
-        }
-        r = requests.post(
+        body = _silence_body(matchers, minutes=minutes, created_by=created_by, comment=comment)
+        r = self.session.post(
             f"{self.base_url}/api/v2/silences",
-            json=body,
+            data=_json_dumps(body),
+            headers=_JSON_HEADERS,
             timeout=self.timeout,
         )
         r.raise_for_status()
-        return r.json().get("silenceID", "")
+        return _json_loads(r.content).get("silenceID", "")
 
 
 class NautobotClient:
@@ -413,29 +712,86 @@ class NautobotClient:
         token: str | None = None,
         token_secret_block: str = "nautobot-token",
         timeout: int = 10,
+        device_cache_ttl: float = 30.0,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.session = _http_session()
         self._token = token
         self._token_secret_block = token_secret_block
+        self._headers: dict[str, str] | None = None
+        self.device_cache_ttl = device_cache_ttl
+        self._device_cache: dict[str, tuple[float, dict]] = {}  # name -> (expires_at, device)
+        self._inflight: dict[str, Future] = {}  # name -> lookup already on the wire
+        self._inflight_lock = threading.Lock()
 
     @property
     def token(self) -> str:
-        if self._token:
-            return self._token
-        return _load_secret(self._token_secret_block)
+        if not self._token:
+            self._token = _load_secret(self._token_secret_block)
+        return self._token
+
+    @property
+    def headers(self) -> dict[str, str]:
+        # Built once, on first use
+        if self._headers is None:
+            self._headers = {"Authorization": f"Token {self.token}", "Accept": "application/json"}
+        return self._headers
 
     def get_device(self, device_name: str) -> dict | None:
-        headers = {"Authorization": f"Token {self.token}", "Accept": "application/json"}
-        r = requests.get(
+        """
+        Device lookup by name. Found devices are cached for `device_cache_ttl`
+        seconds, and concurrent lookups of the same name (e.g. several peers
+        collected in parallel) share a single Nautobot GET.
+        """
+        dev = _cached_device(self._device_cache, device_name)
+        if dev is not None:
+            return dev
+
+        with self._inflight_lock:
+            fut = self._inflight.get(device_name)
+            leader = fut is None
+            if leader:
+                # A previous leader may have cached the device and left _inflight since the check above
+                dev = _cached_device(self._device_cache, device_name)
+                if dev is not None:
+                    return dev
+                fut = self._inflight[device_name] = Future()
+
+        if not leader:
+            return fut.result()
+
+        try:
+            dev = self._fetch_device(device_name)
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        else:
+            fut.set_result(dev)
+            return dev
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(device_name, None)
+
+    def _fetch_device(self, device_name: str) -> dict | None:
+        r = self.session.get(
             f"{self.base_url}/api/dcim/devices/",
-            headers=headers,
+            headers=self.headers,
             params={"name": device_name},
             timeout=self.timeout,
         )
         r.raise_for_status()
-        results = r.json().get("results", [])
-        return results[0] if results else None
+        results = _json_loads(r.content).get("results", [])
+        if not results:
+            return None
+
+        self._device_cache[device_name] = (time.monotonic() + self.device_cache_ttl, results[0])
+        return results[0]
+
+    def refresh_device(self, device_name: str) -> dict | None:
+        """Drop the cached copy (e.g. after editing the device in Nautobot) and fetch it again."""
+        self._device_cache.pop(device_name, None)
+        return self.get_device(device_name)
 
     # ---- SoT helpers (pure functions over device dict) ----
 
@@ -464,13 +820,18 @@ class NautobotClient:
         return None
 
     def build_bgp_intent_gate(self, device: str, peer_address: str, afi_safi: str) -> dict[str, Any]:
-        dev = self.get_device(device)
+        return self.intent_gate_from_device(
+            self.get_device(device), device=device, peer_address=peer_address, afi_safi=afi_safi
+        )
+
+    @staticmethod
+    def intent_gate_from_device(dev: dict | None, device: str, peer_address: str, afi_safi: str) -> dict[str, Any]:
         if not dev:
             return {"found": False, "reason": "device not found in Nautobot"}
 
-        maintenance = self.is_device_in_maintenance(dev)
+        maintenance = NautobotClient.is_device_in_maintenance(dev)
 
-        session = self.get_intended_bgp_session(dev, afi_safi=afi_safi, peer_address=peer_address)
+        session = NautobotClient.get_intended_bgp_session(dev, afi_safi=afi_safi, peer_address=peer_address)
         intended = session is not None
         expected_state = (session or {}).get("expected_state")  # "established" or "down" in your YAML
 
@@ -486,6 +847,149 @@ class NautobotClient:
         }
 
 
+# ------------------------
+# Async clients (optional, need httpx)
+# ------------------------
+
+
+def _async_http_client(base_url: str, timeout: int) -> "httpx.AsyncClient":
+    """
+    One AsyncClient per backend: all concurrent requests share its keep-alive
+    pool (and a single multiplexed connection when HTTP/2 is available).
+    """
+    if httpx is None:
+        raise RuntimeError("httpx is required for the Async* clients (pip install 'httpx[http2]').")
+    return httpx.AsyncClient(
+        base_url=base_url.rstrip("/"),
+        http2=_HTTP2,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=timeout,
+    )
+
+
+class AsyncPromClient:
+    def __init__(self, base_url: str, timeout: int = 10):
+        self.client = _async_http_client(base_url, timeout)
+
+    async def instant(self, query: str) -> list[dict]:
+        r = await self.client.get("/api/v1/query", params={"query": query})
+        r.raise_for_status()
+        return _json_loads(r.content).get("data", {}).get("result", [])
+
+    async def instant_multi(self, queries: dict[str, str], matchers: str) -> dict[str, list[dict]]:
+        result = await self.instant(_prom_multi_query(queries, matchers))
+        return _prom_split_by_name(result, queries)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class AsyncLokiClient:
+    def __init__(self, base_url: str, timeout: int = 10):
+        self.client = _async_http_client(base_url, timeout)
+
+    async def query_range(self, query: str, minutes: int = 10, limit: int = 200) -> list[str]:
+        r = await self.client.get(
+            "/loki/api/v1/query_range", params=_loki_range_params(query, minutes=minutes, limit=limit)
+        )
+        r.raise_for_status()
+        return _loki_lines(_json_loads(r.content), limit=limit)
+
+    async def annotate(self, labels: dict[str, str], message: str) -> None:
+        r = await self.client.post(
+            "/loki/api/v1/push",
+            content=_json_dumps(_loki_push_payload(labels, message)),
+            headers=_JSON_HEADERS,
+        )
+        r.raise_for_status()
+
+    async def annotate_many(self, entries: Iterable[tuple[dict[str, str], str]]) -> None:
+        r = await self.client.post(
+            "/loki/api/v1/push",
+            content=_json_dumps(_loki_push_payload_many(entries)),
+            headers=_JSON_HEADERS,
+        )
+        r.raise_for_status()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class AsyncAlertmanagerClient:
+    def __init__(self, base_url: str, timeout: int = 10):
+        self.client = _async_http_client(base_url, timeout)
+
+    async def create_silence(
+        self,
+        matchers: list[dict[str, Any]],
+        minutes: int = 20,
+        created_by: str = "prefect-workshop",
+        comment: str = "Workshop quarantine: suppress repeat notifications while investigating.",
+    ) -> str:
+        body = _silence_body(matchers, minutes=minutes, created_by=created_by, comment=comment)
+        r = await self.client.post("/api/v2/silences", content=_json_dumps(body), headers=_JSON_HEADERS)
+        r.raise_for_status()
+        return _json_loads(r.content).get("silenceID", "")
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class AsyncNautobotClient:
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        token_secret_block: str = "nautobot-token",
+        timeout: int = 10,
+        device_cache_ttl: float = 30.0,
+    ):
+        self.client = _async_http_client(base_url, timeout)
+        self._token = token
+        self._token_secret_block = token_secret_block
+        self.device_cache_ttl = device_cache_ttl
+        self._device_cache: dict[str, tuple[float, dict]] = {}  # name -> (expires_at, device)
+        self._inflight: dict[str, asyncio.Task] = {}  # name -> lookup already on the wire
+
+    async def headers(self) -> dict[str, str]:
+        if not self._token:
+            # Secret.load is sync; run it off the event loop
+            self._token = await asyncio.to_thread(_load_secret, self._token_secret_block)
+        return {"Authorization": f"Token {self._token}", "Accept": "application/json"}
+
+    async def get_device(self, device_name: str) -> dict | None:
+        # Concurrent lookups of the same device await one shared request
+        task = self._inflight.get(device_name)
+        if task is None:
+            # Checked right before starting a request, so a finished one's result is reused
+            dev = _cached_device(self._device_cache, device_name)
+            if dev is not None:
+                return dev
+            task = self._inflight[device_name] = asyncio.ensure_future(self._fetch_device(device_name))
+            task.add_done_callback(lambda _: self._inflight.pop(device_name, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_device(self, device_name: str) -> dict | None:
+        r = await self.client.get(
+            "/api/dcim/devices/", headers=await self.headers(), params={"name": device_name}
+        )
+        r.raise_for_status()
+        results = _json_loads(r.content).get("results", [])
+        if not results:
+            return None
+
+        self._device_cache[device_name] = (time.monotonic() + self.device_cache_ttl, results[0])
+        return results[0]
+
+    async def build_bgp_intent_gate(self, device: str, peer_address: str, afi_safi: str) -> dict[str, Any]:
+        return NautobotClient.intent_gate_from_device(
+            await self.get_device(device), device=device, peer_address=peer_address, afi_safi=afi_safi
+        )
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
 # ------------------------
 # Optional LLM RCA (kept standalone)
 # ------------------------
@@ -541,7 +1045,7 @@ class WorkshopSDK:
     - provides 'workshop-level' operations to keep flows readable
     """
 
-    endpoints: Endpoints = Endpoints()
+    endpoints: Endpoints = field(default_factory=Endpoints)
 
     # Optional overrides (useful for local dev without Prefect Secrets)
     nautobot_token: str | None = None
@@ -572,54 +1076,70 @@ class WorkshopSDK:
     def annotate(self, labels: dict[str, str], message: str) -> None:
         self.loki.annotate(labels=labels, message=message)
 
+    def annotate_batch(self, entries: Iterable[tuple[dict[str, str], str]]) -> None:
+        """Write several (labels, message) annotations with one Loki push."""
+        self.loki.annotate_many(entries)
+
     def annotate_decision(self, workflow: str, device: str, peer_address: str, decision: str, message: str) -> None:
-        self.annotate(
-            labels={
-                "source": "prefect",
-                "workflow": workflow,
-                "device": device,
-                "peer_address": peer_address,
-                "decision": decision,
-            },
-            message=message,
-        )
+        self.annotate(labels=_decision_labels(workflow, device, peer_address, decision), message=message)
+
+    def annotate_quarantine(
+        self, workflow: str, device: str, peer_address: str, decision: str, reason: str, silence_id: str
+    ) -> None:
+        """Decision + QUARANTINE action annotations, written with one Loki push."""
+        self.annotate_batch(_quarantine_annotations(workflow, device, peer_address, decision, reason, silence_id))
 
     # ---- BGP helpers ----
 
+    @staticmethod
+    def bgp_matchers(device: str, peer_address: str, afi_safi: str, instance_name: str) -> str:
+        return f'device="{device}",peer_address="{peer_address}",afi_safi_name="{afi_safi}",name="{instance_name}"'
+
     def bgp_queries(self, device: str, peer_address: str, afi_safi: str, instance_name: str) -> dict[str, str]:
         """
         Centralize query construction so students don't fight string formatting.
+        (One query per metric - handy for printing / pasting into the Prometheus UI.)
         """
-        base = f'device="{device}",peer_address="{peer_address}",afi_safi_name="{afi_safi}",name="{instance_name}"'
-        return {
-            "admin_state": f"bgp_admin_state{{{base}}}",
-            "oper_state": f"bgp_oper_state{{{base}}}",
-            "received_routes": f"bgp_received_routes{{{base}}}",
-            "sent_routes": f"bgp_sent_routes{{{base}}}",
-            "suppressed_routes": f"bgp_suppressed_routes{{{base}}}",
-            "active_routes": f"bgp_active_routes{{{base}}}",
-        }
+        base = self.bgp_matchers(device, peer_address, afi_safi, instance_name)
+        return {key: f"{name}{{{base}}}" for key, name, _ in BGP_METRICS}
 
     def bgp_metrics_snapshot(
         self, device: str, peer_address: str, afi_safi: str, instance_name: str
     ) -> dict[str, float]:
-        qs = self.bgp_queries(device=device, peer_address=peer_address, afi_safi=afi_safi, instance_name=instance_name)
-        return {
-            "admin_state": first_prom_value(self.prom.instant(qs["admin_state"]), default=-1),
-            "oper_state": first_prom_value(self.prom.instant(qs["oper_state"]), default=-1),
-            "received_routes": first_prom_value(self.prom.instant(qs["received_routes"]), default=0),
-            "sent_routes": first_prom_value(self.prom.instant(qs["sent_routes"]), default=0),
-            "suppressed_routes": first_prom_value(self.prom.instant(qs["suppressed_routes"]), default=0),
-            "active_routes": first_prom_value(self.prom.instant(qs["active_routes"]), default=0),
-        }
+        # One round-trip for all six metrics (see PromClient.instant_multi)
+        results = self.prom.instant_multi(
+            BGP_METRIC_NAMES,
+            matchers=self.bgp_matchers(device, peer_address, afi_safi, instance_name),
+        )
+        return _bgp_snapshot(results)
+
+    def bgp_metrics_snapshots(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        afi_safi: str = "ipv4-unicast",
+        instance_name: str = "default",
+    ) -> list[dict[str, float]]:
+        """bgp_metrics_snapshot for many (device, peer_address) pairs, queried in parallel (same order as `pairs`)."""
+        queries = [
+            _prom_multi_query(BGP_METRIC_NAMES, self.bgp_matchers(device, peer_address, afi_safi, instance_name))
+            for device, peer_address in pairs
+        ]
+        results = self.prom.instant_many(queries)
+        return [_bgp_snapshot(_prom_split_by_name(result, BGP_METRIC_NAMES)) for result in results]
 
-    def bgp_logql(self, device: str, peer_address: str) -> str:
+    @staticmethod
+    def bgp_logql(device: str, peer_address: str) -> str:
         """
         Centralize the "reasonable starter" LogQL:
         - filters license noise
         - looks for common BGP terms + peer ip
+
+        Plain substring filters (`|= "a" or "b"`) instead of a `|~` regex:
+        Loki evaluates them much more cheaply, and the peer IP is matched
+        literally (a regex would treat its dots as wildcards).
         """
-        return f'{{device="{device}"}} != "license" |~ "(bgp|BGP|neighbor|session|route|ipv4-unicast|{peer_address})"'
+        terms = " or ".join(f'"{t}"' for t in (*BGP_LOG_TERMS, peer_address))
+        return f'{{device="{device}"}} != "license" |= {terms}'
 
     def bgp_logs(self, device: str, peer_address: str, minutes: int = 10, limit: int = 200) -> list[str]:
         return self.loki.query_range(
@@ -630,14 +1150,7 @@ class WorkshopSDK:
         """
         One-liner for the quarantine action: silence in Alertmanager.
         """
-        silence_id = self.am.create_silence(
-            matchers=[
-                {"name": "alertname", "value": "BgpSessionNotUp", "isRegex": False},
-                {"name": "device", "value": device, "isRegex": False},
-                {"name": "peer_address", "value": peer_address, "isRegex": False},
-            ],
-            minutes=minutes,
-        )
+        silence_id = self.am.create_silence(matchers=_bgp_silence_matchers(device, peer_address), minutes=minutes)
         return silence_id
 
     def collect_bgp_evidence(
@@ -656,11 +1169,175 @@ class WorkshopSDK:
             instance_name=instance_name,
         )
 
-        ev.sot = self.bgp_gate(device=device, peer_address=peer_address, afi_safi=afi_safi)
-        ev.metrics = self.bgp_metrics_snapshot(
-            device=device, peer_address=peer_address, afi_safi=afi_safi, instance_name=instance_name
-        )
+        # Nautobot, Prometheus and Loki are independent -> query them in parallel
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            sot_fut = pool.submit(self.bgp_gate, device=device, peer_address=peer_address, afi_safi=afi_safi)
+            metrics_fut = pool.submit(
+                self.bgp_metrics_snapshot,
+                device=device,
+                peer_address=peer_address,
+                afi_safi=afi_safi,
+                instance_name=instance_name,
+            )
+            logs_fut = pool.submit(
+                self.bgp_logs, device=device, peer_address=peer_address, minutes=log_minutes, limit=log_limit
+            )
+
+            ev.sot = sot_fut.result()
+            ev.metrics = metrics_fut.result()
+            ev.logs = logs_fut.result()
+
         ev.sot["decoded"] = decode_bgp_states(ev.metrics)
-        ev.logs = self.bgp_logs(device=device, peer_address=peer_address, minutes=log_minutes, limit=log_limit)
 
         return ev
+
+    async def collect_bgp_evidence_async(
+        self,
+        device: str,
+        peer_address: str,
+        afi_safi: str,
+        instance_name: str,
+        log_minutes: int = 10,
+        log_limit: int = 200,
+    ) -> EvidenceBundle:
+        """
+        collect_bgp_evidence for async callers (e.g. async Prefect tasks): runs it on a
+        worker thread so the event loop stays free. (For many pairs at once, see AsyncWorkshopSDK.)
+        """
+        return await asyncio.to_thread(
+            self.collect_bgp_evidence,
+            device=device,
+            peer_address=peer_address,
+            afi_safi=afi_safi,
+            instance_name=instance_name,
+            log_minutes=log_minutes,
+            log_limit=log_limit,
+        )
+
+
+@dataclass
+class AsyncWorkshopSDK:
+    """
+    asyncio flavour of WorkshopSDK for batch work (many device/peer pairs).
+
+    Usage:
+        async with AsyncWorkshopSDK() as sdk:
+            bundles = await sdk.collect_bgp_evidence_many([("srl1", "10.1.2.2"), ("srl2", "10.1.2.1")])
+    """
+
+    endpoints: Endpoints = field(default_factory=Endpoints)
+
+    nautobot_token: str | None = None
+    nautobot_secret_block: str = "nautobot-token"
+
+    timeout: int = 10
+
+    def __post_init__(self) -> None:
+        self.prom = AsyncPromClient(self.endpoints.prom_url, timeout=self.timeout)
+        self.loki = AsyncLokiClient(self.endpoints.loki_url, timeout=self.timeout)
+        self.am = AsyncAlertmanagerClient(self.endpoints.alertmanager_url, timeout=self.timeout)
+        self.nb = AsyncNautobotClient(
+            self.endpoints.nautobot_url,
+            token=self.nautobot_token,
+            token_secret_block=self.nautobot_secret_block,
+            timeout=self.timeout,
+        )
+
+    async def __aenter__(self) -> AsyncWorkshopSDK:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await asyncio.gather(self.prom.aclose(), self.loki.aclose(), self.am.aclose(), self.nb.aclose())
+
+    async def bgp_gate(self, device: str, peer_address: str, afi_safi: str) -> dict[str, Any]:
+        return await self.nb.build_bgp_intent_gate(device=device, peer_address=peer_address, afi_safi=afi_safi)
+
+    async def annotate(self, labels: dict[str, str], message: str) -> None:
+        await self.loki.annotate(labels=labels, message=message)
+
+    async def annotate_batch(self, entries: Iterable[tuple[dict[str, str], str]]) -> None:
+        await self.loki.annotate_many(entries)
+
+    async def annotate_decision(
+        self, workflow: str, device: str, peer_address: str, decision: str, message: str
+    ) -> None:
+        await self.annotate(labels=_decision_labels(workflow, device, peer_address, decision), message=message)
+
+    async def annotate_quarantine(
+        self, workflow: str, device: str, peer_address: str, decision: str, reason: str, silence_id: str
+    ) -> None:
+        await self.annotate_batch(
+            _quarantine_annotations(workflow, device, peer_address, decision, reason, silence_id)
+        )
+
+    async def quarantine_bgp(self, device: str, peer_address: str, minutes: int = 20) -> str:
+        return await self.am.create_silence(matchers=_bgp_silence_matchers(device, peer_address), minutes=minutes)
+
+    async def bgp_metrics_snapshot(
+        self, device: str, peer_address: str, afi_safi: str, instance_name: str
+    ) -> dict[str, float]:
+        results = await self.prom.instant_multi(
+            BGP_METRIC_NAMES,
+            matchers=WorkshopSDK.bgp_matchers(device, peer_address, afi_safi, instance_name),
+        )
+        return _bgp_snapshot(results)
+
+    async def bgp_logs(self, device: str, peer_address: str, minutes: int = 10, limit: int = 200) -> list[str]:
+        return await self.loki.query_range(
+            WorkshopSDK.bgp_logql(device=device, peer_address=peer_address), minutes=minutes, limit=limit
+        )
+
+    async def collect_bgp_evidence(
+        self,
+        device: str,
+        peer_address: str,
+        afi_safi: str,
+        instance_name: str,
+        log_minutes: int = 10,
+        log_limit: int = 200,
+    ) -> EvidenceBundle:
+        sot, metrics, logs = await asyncio.gather(
+            self.bgp_gate(device=device, peer_address=peer_address, afi_safi=afi_safi),
+            self.bgp_metrics_snapshot(
+                device=device, peer_address=peer_address, afi_safi=afi_safi, instance_name=instance_name
+            ),
+            self.bgp_logs(device=device, peer_address=peer_address, minutes=log_minutes, limit=log_limit),
+        )
+        sot["decoded"] = decode_bgp_states(metrics)
+        return EvidenceBundle(
+            device=device,
+            peer_address=peer_address,
+            afi_safi=afi_safi,
+            instance_name=instance_name,
+            metrics=metrics,
+            logs=logs,
+            sot=sot,
+        )
+
+    async def collect_bgp_evidence_many(
+        self,
+        pairs: Iterable[tuple[str, str]],
+        afi_safi: str = "ipv4-unicast",
+        instance_name: str = "default",
+        log_minutes: int = 10,
+        log_limit: int = 200,
+    ) -> list[EvidenceBundle]:
+        """Evidence for every (device, peer_address) pair, collected concurrently (same order as `pairs`)."""
+        return list(
+            await asyncio.gather(
+                *(
+                    self.collect_bgp_evidence(
+                        device=device,
+                        peer_address=peer_address,
+                        afi_safi=afi_safi,
+                        instance_name=instance_name,
+                        log_minutes=log_minutes,
+                        log_limit=log_limit,
+                    )
+                    for device, peer_address in pairs
+                )
+            )
+        )
@@ -1,11 +1,73 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import contextvars
+import logging
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import Any, NamedTuple
 
 from netobs_workshop_sdk import Decision, DecisionPolicy, EvidenceBundle, WorkshopSDK
-from prefect import flow, tags, task
+from prefect import Flow, flow, serve, tags, task
+from prefect.deployments import run_deployment
+from prefect.exceptions import ObjectNotFound
 from prefect.logging import get_run_logger
 
+# Workshop narration (print -> one Prefect log record per line) is opt-in: NETOBS_VERBOSE=1
+_VERBOSE = os.getenv("NETOBS_VERBOSE", "0") == "1"
+_LOG_PRINTS = _VERBOSE
+
+# Alert names alert_receiver acts on (register new alert types here)
+_HANDLED_ALERTS = frozenset({"BgpSessionNotUp"})
+
+# Max per-alert flows running at once (keeps fan-out against Nautobot/Prometheus/Loki bounded)
+MAX_CONCURRENT_ALERT_FLOWS = 8
+
+# Served alongside alert-receiver so resolved alerts can be handed off (see _hand_off_resolved)
+RESOLVED_BGP_DEPLOYMENT = "resolved-bgp"
+
+
+@lru_cache(maxsize=1)
+def _sdk() -> WorkshopSDK:
+    # One SDK per worker process: its clients keep pooled HTTP sessions (and the
+    # Nautobot token/device cache), so tasks reuse connections instead of reconnecting
+    return WorkshopSDK()
+
+
+@lru_cache(maxsize=1024)
+def _build_tags(device: str, peer_address: str, afi_safi: str, instance_name: str, kind: str) -> tuple[str, ...]:
+    # Prefect run tags for a per-peer flow (kind: "action:quarantine", "status:resolved", ...)
+    return (
+        f"device:{device}",
+        f"peer_address:{peer_address}",
+        f"afi_safi:{afi_safi}",
+        f"instance:{instance_name}",
+        kind,
+    )
+
+
+# Workflow name for the annotation tasks, set per flow run (see _workflow_context);
+# the default keeps the tasks usable on their own, outside the flows below
+_WORKFLOW: contextvars.ContextVar[str] = contextvars.ContextVar("workflow", default="demo_quarantine_bgp")
+
+
+@contextmanager
+def _workflow_context(workflow: str):
+    token = _WORKFLOW.set(workflow)
+    try:
+        yield
+    finally:
+        _WORKFLOW.reset(token)
+
+
+def _narrate(msg: str, *args: object) -> None:
+    # %-style like logging: one print (-> one log record) per call, and the
+    # message isn't even formatted unless verbose
+    if _VERBOSE:
+        print(msg % args if args else msg)
+
 
 # -------------------------------------------------------------------
 # Tasks (small + readable; use SDK objects directly)
@@ -13,10 +75,9 @@ from prefect.logging import get_run_logger
 @task(
     retries=2,
     retry_delay_seconds=3,
-    log_prints=True,
     task_run_name="collect_evidence[{device}:{peer_address}]",
 )
-def collect_bgp_evidence_task(
+async def collect_bgp_evidence_task(
     device: str,
     peer_address: str,
     afi_safi: str,
@@ -25,16 +86,9 @@ def collect_bgp_evidence_task(
     log_limit: int,
 ) -> EvidenceBundle:
     logger = get_run_logger()
-    print("🔎 [collect] Starting evidence collection")
-    print(f"   - device={device}")
-    print(f"   - peer_address={peer_address}")
-    print(f"   - afi_safi={afi_safi}")
-    print(f"   - instance_name={instance_name}")
-    print(f"   - log_minutes={log_minutes} log_limit={log_limit}")
 
-    sdk = WorkshopSDK()
-
-    ev = sdk.collect_bgp_evidence(
+    # Nautobot, Prometheus and Loki are awaited together without blocking other alerts' flows
+    ev = await _sdk().collect_bgp_evidence_async(
         device=device,
         peer_address=peer_address,
         afi_safi=afi_safi,
@@ -46,43 +100,56 @@ def collect_bgp_evidence_task(
     sot = ev.sot or {}
     decoded = sot.get("decoded") or {}
     metrics = ev.metrics or {}
-
-    print("✅ [collect] Evidence collected")
-    print(
-        "   - SoT gate:"
-        f" found={sot.get('found')}"
-        f" maintenance={sot.get('maintenance')}"
-        f" intended_peer={sot.get('intended_peer')}"
-        f" expected_state={sot.get('expected_state')}"
-    )
-    print(f"   - Decoded states: admin={decoded.get('admin_state')} oper={decoded.get('oper_state')}")
-    print(
-        "   - Raw states:"
-        f" admin_state={metrics.get('admin_state')}"
-        f" oper_state={metrics.get('oper_state')}"
-        f" rx={metrics.get('received_routes')}"
-        f" tx={metrics.get('sent_routes')}"
-        f" act={metrics.get('active_routes')}"
-        f" sup={metrics.get('suppressed_routes')}"
+    # Built once here and memoized on the bundle, so the flow's ev.summary() is free
+    summary = ev.summary()
+
+    # One record per task (each print under log_prints becomes its own Prefect API log write)
+    logger.info(
+        "🔎 [collect] Evidence collected: found=%s maintenance=%s intended_peer=%s expected_state=%s"
+        " admin=%s oper=%s logs=%d hint=%s",
+        sot.get("found"),
+        sot.get("maintenance"),
+        sot.get("intended_peer"),
+        sot.get("expected_state"),
+        decoded.get("admin_state"),
+        decoded.get("oper_state"),
+        len(ev.logs),
+        summary.get("bgp_metrics_hint"),
+        extra={
+            "device": device,
+            "peer": peer_address,
+            "afi_safi": afi_safi,
+            "instance_name": instance_name,
+            "sot_found": sot.get("found"),
+            "rx": metrics.get("received_routes"),
+            "tx": metrics.get("sent_routes"),
+            "logs": len(ev.logs),
+        },
     )
-    print(f"   - Logs: {len(ev.logs)} lines")
 
-    # A short hint is great for narration
-    hint = ev.summary().get("bgp_metrics_hint")
-    logger.info("BGP hint: %s", hint)
+    # Raw counters are debug-only; %-args are only formatted if the record is emitted
+    logger.debug(
+        "metrics device=%s peer=%s admin_state=%s oper_state=%s rx=%s tx=%s act=%s sup=%s",
+        device,
+        peer_address,
+        metrics.get("admin_state"),
+        metrics.get("oper_state"),
+        metrics.get("received_routes"),
+        metrics.get("sent_routes"),
+        metrics.get("active_routes"),
+        metrics.get("suppressed_routes"),
+    )
 
-    # Optional: show a couple of log samples (kept small)
-    if ev.logs:
-        sample = ev.logs[:2]
-        print("   - Log sample:")
-        for line in sample:
-            print(f"     • {line}")
+    # Optional: show a couple of log samples (kept small, debug only)
+    if logger.isEnabledFor(logging.DEBUG):
+        for line in islice(ev.logs, 2):
+            logger.debug("log sample: %s", line)
 
     return ev
 
 
-@task(log_prints=True, task_run_name="evaluate_policy[{device}:{peer_address}]")
-def evaluate_policy_task(device: str, peer_address: str, ev: EvidenceBundle) -> Decision:
+@task(task_run_name="evaluate_policy[{device}:{peer_address}]")
+async def evaluate_policy_task(device: str, peer_address: str, ev: EvidenceBundle) -> Decision:
     """
     Uses your DecisionPolicy exactly:
       - SoT only => stop/skip/proceed
@@ -90,100 +157,129 @@ def evaluate_policy_task(device: str, peer_address: str, ev: EvidenceBundle) ->
     """
     logger = get_run_logger()
 
-    print("🧠 [policy] Evaluating decision policy (two-stage)")
-    print(f"   - device={device} peer_address={peer_address}")
-    print("   - Stage 1: SoT-only gate (maintenance / intended / expected_state)")
-
     policy = DecisionPolicy()
 
-    sot_decision = policy.evaluate(ev.sot, metrics=None)
-    print(f"   - SoT decision: decision={sot_decision.decision} ok={sot_decision.ok} reason={sot_decision.reason}")
-    if sot_decision.details:
-        logger.info("SoT decision details: %s", sot_decision.details)
-
-    if sot_decision.decision in {"stop", "skip"}:
-        print("🛑 [policy] Exiting early due to SoT gate")
-        return sot_decision
-
-    print("   - Stage 2: SoT + metrics check (intent vs reality)")
-    metrics_decision = policy.evaluate(ev.sot, metrics=ev.metrics)
-    print(
-        "   - Metrics decision:"
-        f" decision={metrics_decision.decision}"
-        f" ok={metrics_decision.ok}"
-        f" reason={metrics_decision.reason}"
+    # Stage 1 (SoT gate) and stage 2 (SoT + metrics) share one SoT parse;
+    # metrics are only checked when the gate doesn't already stop/skip
+    sot_decision, decision = policy.evaluate_two_stage(ev.sot, ev.metrics)
+    stage = "sot" if sot_decision.decision in {"stop", "skip"} else "sot+metrics"
+
+    logger.info(
+        "🧠 [policy] stage=%s decision=%s ok=%s reason=%s details=%s",
+        stage,
+        decision.decision,
+        decision.ok,
+        decision.reason,
+        decision.details,
+        extra={"device": device, "peer": peer_address, "stage": stage, "decision": decision.decision},
     )
-    if metrics_decision.details:
-        logger.info("Metrics decision details: %s", metrics_decision.details)
-
-    return metrics_decision
+    return decision
 
 
-@task(log_prints=True, task_run_name="annotate_decision[{device}:{peer_address}]")
-def annotate_decision_task(
-    workflow: str,
+@task(task_run_name="annotate_decision[{device}:{peer_address}]")
+async def annotate_decision_task(
     device: str,
     peer_address: str,
     decision: Decision,
 ) -> None:
-    print("📝 [annotate] Writing decision annotation to Loki")
-    print(f"   - workflow={workflow}")
-    print(f"   - device={device} peer_address={peer_address}")
-    print(f"   - decision={decision.decision} reason={decision.reason}")
+    logger = get_run_logger()
+    workflow = _WORKFLOW.get()
 
-    sdk = WorkshopSDK()
-    sdk.annotate_decision(
+    sdk = _sdk()
+    await asyncio.to_thread(
+        sdk.annotate_decision,
         workflow=workflow,
         device=device,
         peer_address=peer_address,
         decision=decision.decision,
         message=decision.reason,
     )
-    print("✅ [annotate] Decision annotation written")
+    logger.info(
+        "📝 [annotate] Decision annotation written: workflow=%s decision=%s reason=%s",
+        workflow,
+        decision.decision,
+        decision.reason,
+        extra={"device": device, "peer": peer_address, "workflow": workflow, "decision": decision.decision},
+    )
 
 
-@task(log_prints=True, task_run_name="quarantine[{device}:{peer_address}]")
-def quarantine_task(device: str, peer_address: str, minutes: int) -> str:
-    print("🔕 [quarantine] Creating Alertmanager silence (quarantine)")
-    print(f"   - device={device} peer_address={peer_address} minutes={minutes}")
+@task(task_run_name="quarantine[{device}:{peer_address}]")
+async def quarantine_task(device: str, peer_address: str, minutes: int) -> str:
+    logger = get_run_logger()
 
-    sdk = WorkshopSDK()
-    silence_id = sdk.quarantine_bgp(device=device, peer_address=peer_address, minutes=minutes)
+    sdk = _sdk()
+    silence_id = await asyncio.to_thread(
+        sdk.quarantine_bgp, device=device, peer_address=peer_address, minutes=minutes
+    )
 
-    print(f"✅ [quarantine] Silence created: {silence_id}")
+    logger.info(
+        "🔕 [quarantine] Silence created: %s (minutes=%s)",
+        silence_id,
+        minutes,
+        extra={"device": device, "peer": peer_address, "silence_id": silence_id, "minutes": minutes},
+    )
     return silence_id
 
 
-@task(log_prints=True, task_run_name="annotate_action[{device}:{peer_address}]")
-def annotate_action_task(
-    workflow: str,
+@task(task_run_name="annotate_batch[{device}:{peer_address}]")
+async def annotate_batch_task(
     device: str,
     peer_address: str,
+    decision: Decision,
     silence_id: str,
 ) -> None:
-    print("📝 [annotate] Writing action annotation to Loki")
-    print(f"   - workflow={workflow}")
-    print(f"   - device={device} peer_address={peer_address}")
-    print(f"   - silence_id={silence_id}")
-
-    sdk = WorkshopSDK()
-    sdk.annotate(
-        labels={
-            "source": "prefect",
-            "workflow": workflow,
-            "device": device,
-            "peer_address": peer_address,
-        },
-        message=f"QUARANTINE applied (silence_id={silence_id})",
+    """Decision + action annotations for the quarantine path, in one Loki push."""
+    logger = get_run_logger()
+    workflow = _WORKFLOW.get()
+
+    sdk = _sdk()
+    await asyncio.to_thread(
+        sdk.annotate_quarantine,
+        workflow=workflow,
+        device=device,
+        peer_address=peer_address,
+        decision=decision.decision,
+        reason=decision.reason,
+        silence_id=silence_id,
+    )
+    logger.info(
+        "📝 [annotate] Decision + action annotations written: workflow=%s decision=%s silence_id=%s",
+        workflow,
+        decision.decision,
+        silence_id,
+        extra={"device": device, "peer": peer_address, "workflow": workflow, "silence_id": silence_id},
     )
-    print("✅ [annotate] Action annotation written")
 
 
 # -------------------------------------------------------------------
 # Action flows (triggered by alert_receiver)
 # -------------------------------------------------------------------
-@flow(log_prints=True, flow_run_name="quarantine_bgp | {device}:{peer_address}")
-def quarantine_bgp_flow(
+def _decision_to_dict(d: Decision) -> dict[str, Any]:
+    return {"ok": d.ok, "decision": d.decision, "reason": d.reason, "details": d.details}
+
+
+def _result(
+    device: str,
+    peer_address: str,
+    action: str,
+    extra: dict[str, Any],
+    decision: Decision,
+    summary: dict[str, Any],
+) -> dict[str, Any]:
+    # Flow return value; `extra` holds action-specific keys (e.g. silence_id)
+    return {
+        "device": device,
+        "peer_address": peer_address,
+        "action": action,
+        **extra,
+        "decision": _decision_to_dict(decision),
+        # copy: ev.summary() is the bundle's cached dict, not ours to hand out
+        "evidence_summary": dict(summary),
+    }
+
+
+@flow(log_prints=_LOG_PRINTS, flow_run_name="quarantine_bgp | {device}:{peer_address}")
+async def quarantine_bgp_flow(
     device: str,
     peer_address: str,
     afi_safi: str = "ipv4-unicast",
@@ -195,23 +291,32 @@ def quarantine_bgp_flow(
     """
     Demo flow:
       evidence -> decision -> (maybe quarantine) -> annotations
+
+    On the quarantine path the decision and action annotations are written
+    together (one Loki push) once the silence_id is known.
     """
     logger = get_run_logger()
 
-    print("⚙️  [flow] Starting quarantine_bgp_flow")
-    print(f"   - device={device} peer_address={peer_address}")
-    print(f"   - afi_safi={afi_safi} instance_name={instance_name}")
-    print(f"   - log_minutes={log_minutes} log_limit={log_limit}")
-    print(f"   - quarantine_minutes={quarantine_minutes}")
+    _narrate(
+        "⚙️  [flow] Starting quarantine_bgp_flow\n"
+        "   - device=%s peer_address=%s\n"
+        "   - afi_safi=%s instance_name=%s\n"
+        "   - log_minutes=%s log_limit=%s\n"
+        "   - quarantine_minutes=%s",
+        device,
+        peer_address,
+        afi_safi,
+        instance_name,
+        log_minutes,
+        log_limit,
+        quarantine_minutes,
+    )
 
-    with tags(
-        f"device:{device}",
-        f"peer_address:{peer_address}",
-        f"afi_safi:{afi_safi}",
-        f"instance:{instance_name}",
-        "action:quarantine",
+    with (
+        tags(*_build_tags(device, peer_address, afi_safi, instance_name, "action:quarantine")),
+        _workflow_context("demo_quarantine_bgp"),
     ):
-        ev = collect_bgp_evidence_task(
+        ev = await collect_bgp_evidence_task(
             device=device,
             peer_address=peer_address,
             afi_safi=afi_safi,
@@ -220,67 +325,51 @@ def quarantine_bgp_flow(
             log_limit=log_limit,
         )
 
+        # Already built by collect_bgp_evidence_task; reused for every return path below
         summary = ev.summary()
         logger.info("Evidence summary: %s", summary)
 
-        decision = evaluate_policy_task(
+        decision = await evaluate_policy_task(
             device=device,
             peer_address=peer_address,
             ev=ev,
         )
 
-        annotate_decision_task(
-            workflow="demo_quarantine_bgp",
-            device=device,
-            peer_address=peer_address,
-            decision=decision,
-        )
-
         if decision.decision != "proceed":
-            print("✅ [flow] Decision is not actionable — no quarantine will be applied")
-            print(f"   - decision={decision.decision} reason={decision.reason}")
-            return {
-                "device": device,
-                "peer_address": peer_address,
-                "action": "none",
-                "decision": {
-                    "ok": decision.ok,
-                    "decision": decision.decision,
-                    "reason": decision.reason,
-                    "details": decision.details,
-                },
-                "evidence_summary": summary,
-            }
-
-        print("🚨 [flow] Decision is actionable — applying quarantine")
-        silence_id = quarantine_task(device=device, peer_address=peer_address, minutes=quarantine_minutes)
+            await annotate_decision_task(
+                device=device,
+                peer_address=peer_address,
+                decision=decision,
+            )
+            _narrate(
+                "✅ [flow] Decision is not actionable — no quarantine will be applied\n   - decision=%s reason=%s",
+                decision.decision,
+                decision.reason,
+            )
+            return _result(device, peer_address, "none", {}, decision, summary)
+
+        _narrate("🚨 [flow] Decision is actionable — applying quarantine")
+        try:
+            silence_id = await quarantine_task(device=device, peer_address=peer_address, minutes=quarantine_minutes)
+        except Exception:
+            # No silence -> no batched write; still record the proceed decision for the audit trail
+            await annotate_decision_task(device=device, peer_address=peer_address, decision=decision)
+            raise
         logger.info("Quarantine applied: silence_id=%s", silence_id)
 
-        annotate_action_task(
-            workflow="demo_quarantine_bgp",
+        await annotate_batch_task(
             device=device,
             peer_address=peer_address,
+            decision=decision,
             silence_id=silence_id,
         )
 
-        print("✅ [flow] Quarantine flow completed")
-        return {
-            "device": device,
-            "peer_address": peer_address,
-            "action": "quarantine",
-            "silence_id": silence_id,
-            "decision": {
-                "ok": decision.ok,
-                "decision": decision.decision,
-                "reason": decision.reason,
-                "details": decision.details,
-            },
-            "evidence_summary": summary,
-        }
-
-
-@flow(log_prints=True, flow_run_name="resolved_bgp | {device}:{peer_address}")
-def resolved_bgp_flow(
+        _narrate("✅ [flow] Quarantine flow completed")
+        return _result(device, peer_address, "quarantine", {"silence_id": silence_id}, decision, summary)
+
+
+@flow(log_prints=_LOG_PRINTS, flow_run_name="resolved_bgp | {device}:{peer_address}")
+async def resolved_bgp_flow(
     device: str,
     peer_address: str,
     afi_safi: str = "ipv4-unicast",
@@ -289,116 +378,197 @@ def resolved_bgp_flow(
     """
     Minimal resolved handler: keep the audit trail.
     """
-    print("🧊 [flow] Starting resolved_bgp_flow")
-    print(f"   - device={device} peer_address={peer_address}")
-    print(f"   - afi_safi={afi_safi} instance_name={instance_name}")
+    _narrate(
+        "🧊 [flow] Starting resolved_bgp_flow\n   - device=%s peer_address=%s\n   - afi_safi=%s instance_name=%s",
+        device,
+        peer_address,
+        afi_safi,
+        instance_name,
+    )
 
-    with tags(
-        f"device:{device}",
-        f"peer_address:{peer_address}",
-        f"afi_safi:{afi_safi}",
-        f"instance:{instance_name}",
-        "status:resolved",
+    with (
+        tags(*_build_tags(device, peer_address, afi_safi, instance_name, "status:resolved")),
+        _workflow_context("demo_quarantine_bgp"),
     ):
         decision = Decision(ok=False, decision="resolved", reason="Alert resolved", details={})
-        annotate_decision_task(
-            workflow="demo_quarantine_bgp",
+        await annotate_decision_task(
             device=device,
             peer_address=peer_address,
             decision=decision,
         )
-    print("✅ [flow] Resolved flow completed")
+    _narrate("✅ [flow] Resolved flow completed")
 
 
 # -------------------------------------------------------------------
 # Alert receiver (Alertmanager webhook payload -> flow fan-out)
 # -------------------------------------------------------------------
-def _extract_bgp_fields(labels: dict[str, str]) -> dict[str, str]:
-    device = labels.get("device") or labels.get("hostname") or ""
-    peer_address = labels.get("peer_address") or labels.get("peer") or labels.get("neighbor") or ""
-    afi_safi = labels.get("afi_safi_name") or labels.get("afi_safi") or "ipv4-unicast"
-    instance_name = labels.get("name") or labels.get("instance_name") or "default"
-    return {
-        "device": device,
-        "peer_address": peer_address,
-        "afi_safi": afi_safi,
-        "instance_name": instance_name,
-    }
+# Candidate label names per field, in priority order (add new exporters' label names here)
+_DEVICE_KEYS = ("device", "hostname")
+_PEER_KEYS = ("peer_address", "peer", "neighbor")
+_AFI_KEYS = ("afi_safi_name", "afi_safi")
+_INST_KEYS = ("name", "instance_name")
+
+
+def _first(labels: dict[str, str], keys: tuple[str, ...], default: str = "") -> str:
+    for k in keys:
+        v = labels.get(k)
+        if v:
+            return v
+    return default
+
+
+class BgpFields(NamedTuple):
+    device: str
+    peer_address: str
+    afi_safi: str
+    instance_name: str
+
+
+def _extract_bgp_fields(labels: dict[str, str]) -> BgpFields:
+    return BgpFields(
+        _first(labels, _DEVICE_KEYS),
+        _first(labels, _PEER_KEYS),
+        _first(labels, _AFI_KEYS, "ipv4-unicast"),
+        _first(labels, _INST_KEYS, "default"),
+    )
+
+
+def _unique_bgp_alerts(alerts: list[dict[str, Any]], logger: Any) -> list[tuple[dict[str, Any], BgpFields]]:
+    """
+    One (alert, fields) entry per (device, peer_address). Alertmanager groups can
+    repeat the same peer (re-fired with a newer startsAt) -> keep only the latest.
+    """
+    unique: dict[tuple[str, str], tuple[dict[str, Any], BgpFields]] = {}
+    for a in alerts:
+        labels = a.get("labels") or {}
+        fields = _extract_bgp_fields(labels)
+        if not fields.device or not fields.peer_address:
+            logger.warning("Skipping alert instance: missing device/peer_address. labels=%s", labels)
+            continue
+        key = (fields.device, fields.peer_address)
+        prev = unique.get(key)
+        if prev is None or (a.get("startsAt") or "") > (prev[0].get("startsAt") or ""):
+            unique[key] = (a, fields)
+    return list(unique.values())
+
+
+def _narrate_alert(idx: int, total: int, a: dict[str, Any], fields: BgpFields) -> None:
+    if not _VERBOSE:
+        return
+    lines = [f"➡️  [receiver] Processing alert {idx}/{total}", f"   - labels={a.get('labels') or {}}"]
+    for key in ("annotations", "startsAt", "endsAt"):
+        if a.get(key):
+            lines.append(f"   - {key}={a[key]}")
+    lines += [
+        "   - extracted fields:",
+        f"     device={fields.device}",
+        f"     peer_address={fields.peer_address}",
+        f"     afi_safi={fields.afi_safi}",
+        f"     instance_name={fields.instance_name}",
+    ]
+    _narrate("\n".join(lines))
+
+
+async def _run_alert_flows(alert_flows: list[tuple[Flow, BgpFields]], logger: Any) -> None:
+    """
+    Run the per-alert flows concurrently (bounded by a semaphore). Each flow is only
+    called once it gets a slot; raises if any of them failed so the receiver run fails too.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ALERT_FLOWS)
 
+    async def _bounded(alert_flow: Flow, fields: BgpFields) -> Any:
+        async with semaphore:
+            return await alert_flow(**fields._asdict())
+
+    results = await asyncio.gather(
+        *(_bounded(alert_flow, fields) for alert_flow, fields in alert_flows), return_exceptions=True
+    )
+    failed = 0
+    for (_, fields), result in zip(alert_flows, results, strict=True):
+        if isinstance(result, BaseException):
+            failed += 1
+            logger.error("Flow for %s:%s failed: %r", fields.device, fields.peer_address, result)
+    if failed:
+        raise RuntimeError(f"{failed}/{len(alert_flows)} alert flow(s) failed")
 
-@flow(log_prints=True, flow_run_name="alert_receiver | {alertname}:{status}")
+
+async def _hand_off_resolved(fields: BgpFields) -> bool:
+    """
+    Start resolved_bgp_flow via its served deployment without waiting for it (timeout=0).
+    Returns False if that deployment doesn't exist (e.g. alert_receiver run ad hoc).
+    """
+    try:
+        await run_deployment(
+            name=f"{resolved_bgp_flow.name}/{RESOLVED_BGP_DEPLOYMENT}",
+            parameters=fields._asdict(),
+            flow_run_name=f"resolved_bgp | {fields.device}:{fields.peer_address}",
+            timeout=0,
+        )
+    except ObjectNotFound:
+        return False
+    return True
+
+
+@flow(log_prints=_LOG_PRINTS, flow_run_name="alert_receiver | {alertname}:{status}")
 # @flow(log_prints=True, flow_run_name="alert_receiver")
 # def alert_receiver(alert_group: dict[str, Any]) -> None:
-def alert_receiver(alertname: str, status: str, alert_group: dict[str, Any]) -> None:
+async def alert_receiver(alertname: str, status: str, alert_group: dict[str, Any]) -> None:
     logger = get_run_logger()
-    print(f"🏁 [receiver] Starting alert_receiver flow: alertname={alertname} status={status}")
+    _narrate("🏁 [receiver] Starting alert_receiver flow: alertname=%s status=%s", alertname, status)
 
     status = alert_group.get("status", "unknown")
     group_labels = alert_group.get("groupLabels") or {}
     alertname = group_labels.get("alertname") or "unknown"
     alerts = alert_group.get("alerts") or []
 
-    print("📩 [receiver] Alertmanager webhook received")
-    print(f"   - group alertname={alertname} status={status}")
-    print(f"   - group_labels={group_labels}")
-    print(f"   - alerts_in_group={len(alerts)}")
+    _narrate(
+        "📩 [receiver] Alertmanager webhook received\n"
+        "   - group alertname=%s status=%s\n"
+        "   - group_labels=%s\n"
+        "   - alerts_in_group=%d",
+        alertname,
+        status,
+        group_labels,
+        len(alerts),
+    )
 
     # Keep this tight for the workshop demo
-    if alertname not in {"BgpSessionNotUp"}:
-        print(f"🙈 [receiver] Ignoring alertname={alertname} (not part of Workshop 4 demo)")
+    if alertname not in _HANDLED_ALERTS:
+        logger.info("🙈 [receiver] Ignoring alertname=%s (not part of Workshop 4 demo)", alertname)
         return
 
-    for idx, a in enumerate(alerts, start=1):
-        labels = a.get("labels") or {}
-        annotations = a.get("annotations") or {}
-        starts_at = a.get("startsAt")
-        ends_at = a.get("endsAt")
-
-        print(f"➡️  [receiver] Processing alert {idx}/{len(alerts)}")
-        print(f"   - labels={labels}")
-        if annotations:
-            print(f"   - annotations={annotations}")
-        if starts_at:
-            print(f"   - startsAt={starts_at}")
-        if ends_at:
-            print(f"   - endsAt={ends_at}")
-
-        fields = _extract_bgp_fields(labels)
-        device = fields["device"]
-        peer_address = fields["peer_address"]
-
-        print("   - extracted fields:")
-        print(f"     device={device}")
-        print(f"     peer_address={peer_address}")
-        print(f"     afi_safi={fields['afi_safi']}")
-        print(f"     instance_name={fields['instance_name']}")
+    unique = _unique_bgp_alerts(alerts, logger)
+    if len(unique) < len(alerts):
+        _narrate("🧹 [receiver] %d alert(s) -> %d unique device/peer pair(s)", len(alerts), len(unique))
 
-        if not device or not peer_address:
-            logger.warning("Skipping alert instance: missing device/peer_address. labels=%s", labels)
-            continue
+    alert_flows: list[tuple[Flow, BgpFields]] = []
+    handed_off = 0
+    for idx, (a, fields) in enumerate(unique, start=1):
+        _narrate_alert(idx, len(unique), a, fields)
 
         if status == "firing":
-            print("🔥 [receiver] Status=firing → launching quarantine flow")
-            quarantine_bgp_flow(
-                device=device,
-                peer_address=peer_address,
-                afi_safi=fields["afi_safi"],
-                instance_name=fields["instance_name"],
-            )
+            _narrate("🔥 [receiver] Status=firing → launching quarantine flow")
+            alert_flows.append((quarantine_bgp_flow, fields))
+        # Resolved is audit-only -> don't hold the webhook run open for it
+        elif await _hand_off_resolved(fields):
+            _narrate("✅ [receiver] Status!=firing → resolved flow handed off")
+            handed_off += 1
         else:
-            print("✅ [receiver] Status!=firing → launching resolved flow")
-            resolved_bgp_flow(
-                device=device,
-                peer_address=peer_address,
-                afi_safi=fields["afi_safi"],
-                instance_name=fields["instance_name"],
-            )
+            _narrate("✅ [receiver] Status!=firing → launching resolved flow")
+            alert_flows.append((resolved_bgp_flow, fields))
 
-    print("🏁 [receiver] Alert group processed, exiting")
+    await _run_alert_flows(alert_flows, logger)
+
+    logger.info(
+        "🏁 [receiver] Alert group processed (%d flows, %d handed off), exiting", len(alert_flows), handed_off
+    )
 
 
 # -------------------------------------------------------------------
-# Serve entrypoint (Prefect will create a served deployment)
+# Serve entrypoint (Prefect will create the served deployments)
 # -------------------------------------------------------------------
 if __name__ == "__main__":
-    _ = alert_receiver.serve(name="alert-receiver")
+    serve(
+        alert_receiver.to_deployment(name="alert-receiver"),
+        resolved_bgp_flow.to_deployment(name=RESOLVED_BGP_DEPLOYMENT),
+    )